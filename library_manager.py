@@ -11,17 +11,70 @@ Features include:
 """
 
 # Standard library imports
+import io        # For in-memory Parquet encoding
 import json      # For JSON file operations
 import os        # For file system operations
-import time      # For adding delays in UI
+import re        # For tokenizing search fields
+import sys       # For interning repeated strings
+import uuid      # For stable book ids
+from collections import Counter, defaultdict  # For library counts and the search index
+from contextlib import contextmanager  # For batching library writes
 from datetime import datetime  # For timestamping book additions
 
 # Third-party library imports
 import streamlit as st        # Web application framework
 import pandas as pd           # Data manipulation and analysis
-import plotly.express as px   # Interactive data visualization
-import plotly.graph_objects as go  # Custom plotly charts
-import requests               # For potential future API integrations
+
+# Optional third-party imports
+try:
+    import orjson             # Fast C-based JSON serialization
+except ImportError:
+    orjson = None             # Fall back to ujson, then the standard json module
+try:
+    import ujson              # C-based JSON, used when orjson is missing
+except ImportError:
+    ujson = None
+try:
+    import ijson              # Incremental JSON parsing for large files
+except ImportError:
+    ijson = None              # Large files are then read in one go
+
+# App stylesheet, served by Streamlit's static file serving from ./static
+STYLESHEET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'styles.css')
+STYLESHEET_URL = 'app/static/styles.css'
+
+# Storage file locations
+LIBRARY_JSON_FILE = 'library.json'       # JSON snapshot, also migrated from when switching to Parquet
+LIBRARY_FILE = LIBRARY_JSON_FILE         # Persisted book collection; 'library.parquet' selects Parquet storage
+LIBRARY_TMP_FILE = LIBRARY_FILE + '.tmp' # Scratch file for atomic saves
+USE_PARQUET = LIBRARY_FILE.endswith('.parquet')  # Columnar snapshot, needs pyarrow
+LIBRARY_LOG_FILE = 'library.jsonl'       # Append-only log of changes since last save
+WRITE_BUFFER_SIZE = 1 << 16              # Buffer size for library writes
+COMPACT_RATIO = 0.3                      # Compact once stale log records exceed this share of books
+STREAM_THRESHOLD = 16 << 20              # Stream-parse library files larger than this (bytes)
+
+# Earliest publication year the Add form and CSV import accept
+MIN_PUBLICATION_YEAR = 1000
+
+# Search field labels mapped to the casefolded book fields they search
+SEARCH_FIELDS = {"📖 Title": 'title_lc', "✍️ Author": 'author_lc', "🏷️ Category": 'genre_lc'}
+DERIVED_FIELDS = ('title_lc', 'author_lc', 'genre_lc', 'decade')  # Computed in memory, never saved
+METRIC_FIELDS = ('genre', 'author', 'decade', 'read_status')  # Fields the stats view reads
+TOP_AUTHORS = 5  # Authors listed under Favorite Authors
+FIGURE_CACHE_ENTRIES = 64  # Cached figures kept per chart builder, across all sessions
+FRAME_DTYPES = {'genre': 'category', 'author': 'category', 'decade': 'int32', 'read_status': 'bool'}  # Packed column dtypes; int32 holds any year
+TOKEN_PATTERN = re.compile(r'[^\W_]+')  # Alphanumeric runs used as search index tokens
+MIN_INDEXED_TOKEN = 3  # Shorter query tokens match most of the index, so scan instead
+
+# Book card markup, filled in per book with str.format_map
+CARD_TPL = """
+<div class='book-card'>
+    <h3>📖 {title}</h3>
+    <p><strong>✍️ Author:</strong> {author}</p>
+    <p><strong>📅 Published:</strong> {publication_year}</p>
+    <p><strong>🏷️ Category:</strong> {genre}</p>
+    <p><span class="{badge_cls}">{badge_text}</span></p>
+</div>"""
 
 # Configure Streamlit page settings
 # Sets up the web application with a wide layout and expanded sidebar
@@ -31,223 +84,379 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for styling the application
-# Defines styles for headers, messages, book cards, and buttons
-st.markdown("""
-<style>
-    /* Color Variables */
-    :root {
-        --primary-color: #2C3E50;
-        --secondary-color: #34495E;
-        --accent-color: #3498DB;
-        --success-color: #27AE60;
-        --warning-color: #E67E22;
-        --danger-color: #E74C3C;
-        --text-color: #2C3E50;
-        --bg-color: #ECF0F1;
-        --card-bg: #FFFFFF;
-    }
-
-    /* Emoji styling */
-    .emoji {
-        color: initial !important;
-        -webkit-text-fill-color: initial !important;
-        background: none !important;
-    }
-
-    /* Main page header styling */
-    .main-header {
-        font-size: 3rem;
-        color: var(--primary-color);
-        margin-bottom: 1rem;
-        text-align: center;
-        text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.1);
-    }
+# Custom CSS for styling the application, served from static/styles.css
+# Defines styles for headers, messages, book cards, and buttons.
+# Streamlit clears any element a rerun does not emit, so the link has to
+# be sent on every run, but the browser fetches and caches the sheet
+# itself instead of receiving the whole style block each time. The
+# modification time in the URL makes edits to the file show up.
+stylesheet_version = os.stat(STYLESHEET_FILE).st_mtime_ns
+st.markdown(f"<link rel='stylesheet' href='{STYLESHEET_URL}?v={stylesheet_version}'>", unsafe_allow_html=True)
 
-    .main-header span {
-        background: linear-gradient(45deg, var(--primary-color), var(--secondary-color));
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-
-    /* Section header styling */
-    .sub-header {
-        font-size: 2rem !important;
-        color: var(--secondary-color);
-        font-weight: 600;
-        margin-top: 1rem;
-        margin-bottom: 1rem;
-        border-bottom: 2px solid var(--accent-color);
-        padding-bottom: 0.5rem;
-    }
+# Initialize session state variables
+# These variables persist across reruns of the Streamlit app
+if 'book_collection' not in st.session_state:
+    st.session_state.book_collection = {}  # Stores all books in the library, keyed by id
+if 'search_output' not in st.session_state:
+    st.session_state.search_output = []    # Stores search results
+if 'new_book_flag' not in st.session_state:
+    st.session_state.new_book_flag = False # Flag for new book addition
+if 'book_deleted_flag' not in st.session_state:
+    st.session_state.book_deleted_flag = False # Flag for book deletion
+if 'active_section' not in st.session_state:
+    st.session_state.active_section = 'library' # Current active view
+if 'collection_version' not in st.session_state:
+    st.session_state.collection_version = 0 # Bumped on every collection change
+if 'pending_changes' not in st.session_state:
+    st.session_state.pending_changes = []  # Change records not yet written to disk
+if 'library_dirty' not in st.session_state:
+    st.session_state.library_dirty = False # Whether pending_changes needs flushing
+if 'persisted_version' not in st.session_state:
+    st.session_state.persisted_version = -1 # collection_version last saved to library.json
+if 'card_html' not in st.session_state:
+    st.session_state.card_html = {}        # Rendered card HTML per book id, with its read status
 
-    /* Success message styling */
-    .success-message {
-        padding: 1rem;
-        background: linear-gradient(90deg, rgba(39, 174, 96, 0.1), rgba(39, 174, 96, 0.05));
-        border-left: 4px solid var(--success-color);
-        border-radius: 0.375rem;
-        color: var(--success-color);
-    }
+@st.cache_data(show_spinner=False)
+def _read_json(path: str, mtime_ns: int, size: int) -> list:
+    """
+    Read and parse a JSON file, cached across reruns.
+    The file's modification time and size are part of the cache key, so
+    any write to the file invalidates the cached copy automatically.
+    Nanosecond timestamps keep two saves within one second apart.
+    The raw bytes are parsed with orjson or ujson when installed.
     
-    /* Warning message styling */
-    .warning-message {
-        padding: 1rem;
-        background: linear-gradient(90deg, rgba(230, 126, 34, 0.1), rgba(230, 126, 34, 0.05));
-        border-left: 4px solid var(--warning-color);
-        border-radius: 0.375rem;
-        color: var(--warning-color);
-    }
-
-    /* Book card styling */
-    .book-card {
-        padding: 1.5rem;
-        background: linear-gradient(135deg, var(--card-bg), #F8F9FA);
-        border-left: 4px solid var(--accent-color);
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-    }
+    Args:
+        path (str): Path of the JSON file to read
+        mtime_ns (int): Modification time of the file in nanoseconds
+        size (int): Size of the file in bytes
+        
+    Returns:
+        list: Parsed contents of the file
+    """
+    with open(path, 'rb') as file:
+        return _decode_json(file.read())
 
-    /* Hover effect for book cards */
-    .book-card:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        border-left: 4px solid var(--primary-color);
-        background: linear-gradient(135deg, #FFFFFF, #F8F9FA);
-    }
+def _stream_json_list(path: str):
+    """
+    Yield the items of a JSON list file one at a time with ijson.
+    Used instead of _read_json for files larger than STREAM_THRESHOLD.
+    It is deliberately not cached: neither the raw text, nor a parsed
+    list, nor a pickled cache copy is ever held, only the record being
+    parsed next to the books already loaded.
+    
+    Args:
+        path (str): Path of the JSON file to read
+        
+    Yields:
+        Each item of the top-level list
+    """
+    with open(path, 'rb') as file:
+        yield from ijson.items(file, 'item', use_float=True)
 
-    /* Read status badge styling */
-    .read-badge {
-        padding: 0.5rem 1rem;
-        background: linear-gradient(45deg, var(--success-color), #2ECC71);
-        color: white;
-        border-radius: 1rem;
-        font-size: 0.875rem;
-        font-weight: 500;
-        box-shadow: 0 2px 4px rgba(39, 174, 96, 0.2);
-    }
+@st.cache_data(show_spinner=False)
+def _read_parquet(path: str, mtime_ns: int, size: int) -> list:
+    """
+    Read a Parquet library snapshot, cached across reruns.
+    Cached on the file's modification time and size, like _read_json.
+    
+    Args:
+        path (str): Path of the Parquet file to read
+        mtime_ns (int): Modification time of the file in nanoseconds
+        size (int): Size of the file in bytes
+        
+    Returns:
+        list: One dict per book
+    """
+    return pd.read_parquet(path).to_dict('records')
 
-    /* Unread status badge styling */
-    .unread-badge {
-        padding: 0.5rem 1rem;
-        background: linear-gradient(45deg, var(--warning-color), #F39C12);
-        color: white;
-        border-radius: 1rem;
-        font-size: 0.875rem;
-        font-weight: 500;
-        box-shadow: 0 2px 4px rgba(230, 126, 34, 0.2);
-    }
+def _encode_snapshot(books: list) -> bytes:
+    """
+    Encode the library snapshot in the format LIBRARY_FILE uses.
+    Parquet snapshots are zstd-compressed columns; otherwise the
+    snapshot is a JSON list.
+    
+    Args:
+        books (list): Storable book entries
+        
+    Returns:
+        bytes: Encoded snapshot
+    """
+    if USE_PARQUET:
+        buffer = io.BytesIO()
+        pd.DataFrame(books).to_parquet(buffer, compression='zstd', index=False)
+        return buffer.getvalue()
+    return _encode_json(books)
 
-    /* Action button spacing */
-    .action-button {
-        margin-right: 0.5rem;
-    }
+def _encode_json(data) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+    Uses orjson when installed, then ujson, otherwise the standard
+    json module.
+    
+    Args:
+        data: JSON-serializable object
+        
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    if ujson is not None:
+        return ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+    return json.dumps(data).encode('utf-8')
 
-    /* Button styling */
-    .stButton>button {
-        border-radius: 0.375rem;
-        background: linear-gradient(45deg, #4A6CF7, #6B46C1);
-        color: white;
-        border: none;
-        padding: 0.5rem 1rem;
-        font-weight: 500;
-        transition: all 0.3s ease;
-        box-shadow: 0 2px 4px rgba(75, 108, 247, 0.2);
-    }
+def _decode_json(payload: bytes):
+    """
+    Parse UTF-8 JSON bytes.
+    Uses orjson when installed, then ujson, otherwise the standard
+    json module.
+    
+    Args:
+        payload (bytes): Encoded JSON document
+        
+    Returns:
+        Parsed JSON object
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    if ujson is not None:
+        return ujson.loads(payload)
+    return json.loads(payload)
 
-    .stButton>button:hover {
-        background: linear-gradient(45deg, #3B5BDB, #553C9A);
-        box-shadow: 0 4px 6px rgba(75, 108, 247, 0.3);
-        transform: translateY(-1px);
-    }
+def _add_derived_fields(book: dict) -> dict:
+    """
+    Attach the in-memory DERIVED_FIELDS to a book.
+    These are casefolded copies of the searchable fields and the
+    publication decade. Casefolding once here means searches never
+    re-fold book fields, and unlike lower() it also matches forms such
+    as 'ß' and 'ss'. Storing the decade spares the stats from bucketing
+    every year again. Authors and genres repeat across many books, so
+    they are interned and every book shares one copy of each.
+    
+    Args:
+        book (dict): Book entry, updated in place
+        
+    Returns:
+        dict: The same book entry
+    """
+    book['author'] = sys.intern(str(book['author']))
+    book['genre'] = sys.intern(str(book['genre']))
+    book['title_lc'] = str(book['title']).casefold()
+    book['author_lc'] = sys.intern(book['author'].casefold())
+    book['genre_lc'] = sys.intern(book['genre'].casefold())
+    book['decade'] = (int(book['publication_year']) // 10) * 10
+    return book
 
-    /* Form input styling */
-    .stTextInput>div>div>input,
-    .stNumberInput>div>div>input,
-    .stSelectbox>div>div>select {
-        border-radius: 0.375rem;
-        border: 1px solid #BDC3C7;
-        padding: 0.5rem;
-        background: linear-gradient(180deg, #FFFFFF, #F8F9FA);
-    }
+def _storable(book: dict) -> dict:
+    """
+    Strip in-memory derived fields from a book before saving it.
+    
+    Args:
+        book (dict): Book entry
+        
+    Returns:
+        dict: Copy of the book without DERIVED_FIELDS
+    """
+    return {key: value for key, value in book.items() if key not in DERIVED_FIELDS}
 
-    .stTextInput>div>div>input:focus,
-    .stNumberInput>div>div>input:focus,
-    .stSelectbox>div>div>select:focus {
-        border-color: var(--accent-color);
-        box-shadow: 0 0 0 2px rgba(52, 152, 219, 0.1);
-        background: linear-gradient(180deg, #FFFFFF, #F8F9FA);
-    }
+def _append_log(records: list) -> bool:
+    """
+    Append change records to the library change log.
+    Each record is one JSON line, so adding, removing or updating a
+    book costs one small append instead of rewriting the whole library.
+    All records are written together in a single call.
+    
+    Args:
+        records (list): Change records with an 'op' of 'add', 'del' or 'set'
+        
+    Returns:
+        bool: True if successful, False if error occurs
+    """
+    try:
+        payload = b''.join(_encode_json(record) + b'\n' for record in records)
+        with open(LIBRARY_LOG_FILE, 'ab', buffering=WRITE_BUFFER_SIZE) as file:
+            file.write(payload)
+        return True
+    except Exception as e:
+        st.error(f"Error saving library: {e}")
+        return False
 
-    /* Radio button styling */
-    .stRadio>div {
-        background: linear-gradient(180deg, var(--bg-color), #F8F9FA);
-        padding: 1rem;
-        border-radius: 0.375rem;
-    }
+def _queue_change(record: dict) -> None:
+    """
+    Queue a change record to be written at the end of the current run.
+    Marks the library dirty; flush_library_changes() writes every
+    queued record at once, so several changes cost a single write.
+    
+    Args:
+        record (dict): Change record with an 'op' of 'add', 'del' or 'set'
+    """
+    st.session_state.pending_changes.append(record)
+    st.session_state.library_dirty = True
 
-    /* Sidebar styling */
-    .css-1d391kg {
-        background: linear-gradient(180deg, var(--bg-color), #F8F9FA);
-    }
+def flush_library_changes() -> bool:
+    """
+    Write queued changes to the change log if the library is dirty.
+    Called when a batched_writes() block exits. On failure the changes
+    stay queued and are retried on the next run.
+    
+    Returns:
+        bool: True if nothing was pending or the write succeeded, False otherwise
+    """
+    if not st.session_state.library_dirty:
+        return True
+    if not _append_log(st.session_state.pending_changes):
+        return False
+    st.session_state.pending_changes = []
+    st.session_state.library_dirty = False
+    return True
 
-    /* Metric card styling */
-    .stMetric {
-        background: linear-gradient(135deg, var(--card-bg), #F8F9FA);
-        padding: 1rem;
-        border-radius: 0.5rem;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-    }
-</style>
-""", unsafe_allow_html=True)
+@contextmanager
+def batched_writes():
+    """
+    Group the library changes made inside a block into a single write.
+    Changes are only queued while the block runs and are flushed when
+    it exits, including early exits through st.rerun() or an error.
+    Can also be used as a decorator: @batched_writes(). The views are
+    fragments, whose reruns skip the end of the script, so each one is
+    decorated to flush its own changes.
+    """
+    try:
+        yield
+    finally:
+        flush_library_changes()
 
-# Initialize session state variables
-# These variables persist across reruns of the Streamlit app
-if 'book_collection' not in st.session_state:
-    st.session_state.book_collection = []  # Stores all books in the library
-if 'search_output' not in st.session_state:
-    st.session_state.search_output = []    # Stores search results
-if 'new_book_flag' not in st.session_state:
-    st.session_state.new_book_flag = False # Flag for new book addition
-if 'book_deleted_flag' not in st.session_state:
-    st.session_state.book_deleted_flag = False # Flag for book deletion
-if 'active_section' not in st.session_state:
-    st.session_state.active_section = 'library' # Current active view
+def _replay_log(books: dict) -> int:
+    """
+    Apply the change log on top of a loaded library snapshot.
+    Replay stops at the first unreadable line, which can only be a
+    record that was cut off while being written.
+    
+    Args:
+        books (dict): Books from library.json keyed by id, updated in place
+        
+    Returns:
+        int: Number of stale records (removals and updates) in the log
+    """
+    stale_records = 0
+    with open(LIBRARY_LOG_FILE, 'rb') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                record = _decode_json(line)
+            except ValueError:
+                break
+            if record['op'] == 'add':
+                books[record['book']['id']] = record['book']
+            elif record['op'] == 'del':
+                books.pop(record['id'], None)
+                stale_records += 1
+            elif record['op'] == 'set':
+                if record['id'] in books:
+                    books[record['id']].update(record['fields'])
+                stale_records += 1
+    return stale_records
 
 def fetch_library_data() -> bool:
     """
     Load library data from JSON file into session state.
-    This function reads the library.json file and loads its contents
-    into the application's session state.
+    This function reads the library.json file (or library.parquet when
+    that is the configured LIBRARY_FILE), replays any changes
+    recorded in library.jsonl since it was last saved, and loads the
+    result into the application's session state. Parsing is cached on
+    the file's modification time and size, so unchanged files are not
+    re-read.
+    Books are keyed by their 'id'; books saved before ids existed get
+    one assigned, and the library is saved right away so those ids are
+    stable. The library is compacted back into library.json once the
+    log holds too many stale records.
+    After switching LIBRARY_FILE to Parquet, the first load seeds the
+    library from library.json (and its change log), which are the
+    latest saved state, and writes library.parquet right away.
+    Marks the library as loaded so later reruns keep using session state.
     
     Returns:
         bool: True if successful, False if file doesn't exist or error occurs
     """
     try:
-        if os.path.exists('library.json'):
-            with open('library.json', 'r') as file:
-                st.session_state.book_collection = json.load(file)
-                return True
-        return False
+        snapshot_file = LIBRARY_FILE
+        read_snapshot = _read_parquet if USE_PARQUET else _read_json
+        migrating = USE_PARQUET and not os.path.exists(LIBRARY_FILE) and os.path.exists(LIBRARY_JSON_FILE)
+        if migrating:
+            # The change log, if any, was written against library.json
+            snapshot_file = LIBRARY_JSON_FILE
+            read_snapshot = _read_json
+        has_snapshot = os.path.exists(snapshot_file)
+        has_log = os.path.exists(LIBRARY_LOG_FILE)
+        books = {}
+        missing_ids = False
+        if has_snapshot:
+            file_stat = os.stat(snapshot_file)
+            if read_snapshot is _read_json and ijson is not None and file_stat.st_size > STREAM_THRESHOLD:
+                # Stream large files straight into the collection
+                snapshot_books = _stream_json_list(snapshot_file)
+            else:
+                snapshot_books = read_snapshot(snapshot_file, file_stat.st_mtime_ns, file_stat.st_size)
+            for book in snapshot_books:
+                if 'id' not in book:
+                    book['id'] = uuid.uuid4().hex
+                    missing_ids = True
+                books[book['id']] = book
+        stale_records = _replay_log(books) if has_log else 0
+        for book in books.values():
+            # Older files store the read status as the strings "true"/"false"
+            book['read_status'] = _parse_read_status(book.get('read_status', False))
+            _add_derived_fields(book)
+        st.session_state.book_collection = books
+        st.session_state.library_loaded = True
+        _invalidate_caches()
+        if has_snapshot and not has_log and not missing_ids and not migrating:
+            st.session_state.persisted_version = st.session_state.collection_version
+        if migrating or missing_ids or stale_records > COMPACT_RATIO * len(books):
+            persist_library_data()
+        return has_snapshot or has_log
     except Exception as e:
         st.error(f"Error loading library: {e}")
         return False
 
 def persist_library_data() -> bool:
     """
-    Save current library data to JSON file.
-    This function writes the current state of the library
-    to the library.json file for persistence.
+    Save current library data to the library file.
+    Writes the whole collection to LIBRARY_FILE, as JSON (with orjson
+    or ujson when available) or as Parquet, and compacts the change
+    log into it.
+    The snapshot is encoded in one go and written as a single buffered
+    block to a temporary file, which is synced to disk and then
+    atomically replaces the library file, so a crash mid-write can't
+    leave a truncated file behind. Nothing is written when the file
+    already holds the current collection version. The parsed copy of
+    the previous file is dropped from the read cache, since its
+    modification time and size no longer match any file.
     
     Returns:
         bool: True if successful, False if error occurs
     """
+    if st.session_state.persisted_version == st.session_state.collection_version:
+        return True
     try:
-        with open('library.json', 'w') as file:
-            json.dump(st.session_state.book_collection, file)
-            return True
+        payload = _encode_snapshot([_storable(book) for book in st.session_state.book_collection.values()])
+        with open(LIBRARY_TMP_FILE, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+            file.write(payload)
+            # Make the data durable before the rename publishes it
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(LIBRARY_TMP_FILE, LIBRARY_FILE)
+        if os.path.exists(LIBRARY_LOG_FILE):
+            os.remove(LIBRARY_LOG_FILE)
+        if USE_PARQUET:
+            _read_parquet.clear()
+        else:
+            _read_json.clear()
+        # Queued changes are part of the snapshot that was just written
+        st.session_state.pending_changes = []
+        st.session_state.library_dirty = False
+        st.session_state.persisted_version = st.session_state.collection_version
+        return True
     except Exception as e:
         st.error(f"Error saving library: {e}")
         return False
@@ -256,7 +465,7 @@ def insert_book(book_title: str, book_author: str, pub_year: int, book_genre: st
     """
     Add a new book to the library.
     Creates a new book entry with the provided details and adds it to the library.
-    Also updates the JSON file and sets the new book flag.
+    Also queues it for the change log and sets the new book flag.
     
     Args:
         book_title (str): Title of the book
@@ -265,8 +474,9 @@ def insert_book(book_title: str, book_author: str, pub_year: int, book_genre: st
         book_genre (str): Genre of the book
         is_read (bool): Whether the book has been read
     """
-    # Create new book entry with current timestamp
+    # Create new book entry with a fresh id and current timestamp
     new_entry = {
+        'id': uuid.uuid4().hex,
         'title': book_title,
         'author': book_author,
         'publication_year': pub_year,
@@ -274,172 +484,532 @@ def insert_book(book_title: str, book_author: str, pub_year: int, book_genre: st
         'read_status': is_read,
         'added_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     }
-    # Add to library and persist changes
-    st.session_state.book_collection.append(new_entry)
-    persist_library_data()
+    # Add to library and queue the change for the change log
+    st.session_state.book_collection[new_entry['id']] = _add_derived_fields(new_entry)
+    _invalidate_caches()
+    _update_search_index(new_entry['id'], added=new_entry)
+    _update_library_counts(added=new_entry)
+    _queue_change({'op': 'add', 'book': _storable(new_entry)})
     st.session_state.new_book_flag = True
-    time.sleep(0.5)  # Brief delay for UI feedback
 
-def delete_book(book_index: int) -> bool:
+def _parse_read_status(value) -> bool:
+    """
+    Interpret an imported read-status value.
+    Accepts booleans, numbers and common words such as 'true', 'yes'
+    or 'completed'; empty cells count as unread.
+    
+    Args:
+        value: Raw value from an imported row
+        
+    Returns:
+        bool: Whether the book has been read
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', 'yes', '1', 'read', 'completed')
+    return bool(value) and value == value  # NaN (empty cell) is not equal to itself
+
+def _is_valid_entry(entry: dict) -> bool:
+    """
+    Check an imported row against the rules of the Add form.
+    Title, author and genre must be filled in, and the publication year
+    must be a whole number between MIN_PUBLICATION_YEAR and this year.
+    
+    Args:
+        entry (dict): Raw row from an import
+        
+    Returns:
+        bool: True if the row can be added as a book
+        
+    Raises:
+        KeyError: If a required column is missing
+    """
+    for field in ('title', 'author', 'genre'):
+        if pd.isna(entry[field]) or not str(entry[field]).strip():
+            return False
+    try:
+        year = float(entry['publication_year'])
+    except (TypeError, ValueError):
+        return False
+    return year.is_integer() and MIN_PUBLICATION_YEAR <= year <= datetime.now().year
+
+def insert_books(entries: list) -> int:
     """
-    Remove a book from the library by index.
-    Deletes the book at the specified index and updates the JSON file.
+    Add several books to the library in one batch.
+    All entries share one timestamp, caches are invalidated once and
+    the additions are flushed to disk together at the end of the run.
+    Every entry is checked first, so nothing is added if any is invalid.
     
     Args:
-        book_index (int): Index of the book to remove
+        entries (list): Dicts with 'title', 'author', 'publication_year'
+            and 'genre' keys, plus an optional 'read_status'
         
     Returns:
-        bool: True if successful, False if index is invalid
+        int: Number of books added
+        
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If any entry fails _is_valid_entry
     """
-    if 0 <= book_index < len(st.session_state.book_collection):
-        del st.session_state.book_collection[book_index]
-        persist_library_data()
+    bad_rows = [str(row) for row, entry in enumerate(entries, start=1) if not _is_valid_entry(entry)]
+    if bad_rows:
+        raise ValueError(
+            f"row{'s' if len(bad_rows) > 1 else ''} {', '.join(bad_rows)} "
+            f"need a title, author, category and a year between {MIN_PUBLICATION_YEAR} and {datetime.now().year}"
+        )
+
+    added_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    new_entries = [
+        _add_derived_fields({
+            'id': uuid.uuid4().hex,
+            'title': str(entry['title']),
+            'author': str(entry['author']),
+            'publication_year': int(float(entry['publication_year'])),
+            'genre': str(entry['genre']),
+            'read_status': _parse_read_status(entry.get('read_status', False)),
+            'added_date': added_date
+        })
+        for entry in entries
+    ]
+    st.session_state.book_collection.update((new_entry['id'], new_entry) for new_entry in new_entries)
+    _invalidate_caches()
+    for new_entry in new_entries:
+        _queue_change({'op': 'add', 'book': _storable(new_entry)})
+    return len(new_entries)
+
+def delete_book(book_id: str) -> bool:
+    """
+    Remove a book from the library by id.
+    Deletes the book with the specified id and queues the removal
+    for the change log.
+    
+    Args:
+        book_id (str): Id of the book to remove
+        
+    Returns:
+        bool: True if successful, False if id is unknown
+    """
+    book = st.session_state.book_collection.pop(book_id, None)
+    if book is not None:
+        st.session_state.card_html.pop(book_id, None)
+        _invalidate_caches()
+        _update_search_index(book_id, removed=book)
+        _update_library_counts(removed=book)
+        _queue_change({'op': 'del', 'id': book_id})
         st.session_state.book_deleted_flag = True
         return True
     return False
 
+def update_read_status(book_id: str, is_read: bool) -> bool:
+    """
+    Set the read status of a book by id.
+    Updates the book in place and queues the change for the change log.
+    Setting the status a book already has is a no-op and writes nothing.
+    
+    Args:
+        book_id (str): Id of the book to update
+        is_read (bool): New read status
+        
+    Returns:
+        bool: True if successful, False if id is unknown
+    """
+    book = st.session_state.book_collection.get(book_id)
+    if book is not None:
+        if book['read_status'] == is_read:
+            return True
+        previous = dict(book)
+        book['read_status'] = is_read
+        _invalidate_caches()
+        # The read status isn't searched, so the index stays valid
+        _update_search_index(book_id)
+        _update_library_counts(added=book, removed=previous)
+        _queue_change({'op': 'set', 'id': book_id, 'fields': {'read_status': is_read}})
+        return True
+    return False
+
+def _collection_frame() -> pd.DataFrame:
+    """
+    Get a columnar (DataFrame) view of the book collection.
+    Holds one column per field that search and statistics read, so
+    those scan a single contiguous column instead of every book dict.
+    The frame is kept in session state and only rebuilt when the
+    collection version has changed since it was last built.
+    
+    Returns:
+        pd.DataFrame: One row per book, indexed by id, in collection order
+    """
+    if st.session_state.get('books_df_version') != st.session_state.collection_version:
+        books = st.session_state.book_collection
+        columns = {
+            field: [book[field] for book in books.values()]
+            for field in (*SEARCH_FIELDS.values(), *METRIC_FIELDS)
+        }
+        # Compact dtypes: metrics then run over packed arrays and
+        # category codes instead of boxed Python objects
+        st.session_state.books_df = pd.DataFrame(columns, index=list(books)).astype(FRAME_DTYPES)
+        st.session_state.books_df_version = st.session_state.collection_version
+    return st.session_state.books_df
+
+def _index_book(index: dict, book_id: str, book: dict) -> None:
+    """
+    Add one book's tokens to the search index.
+    
+    Args:
+        index (dict): Search index, field -> token -> set of book ids
+        book_id (str): Id of the book
+        book (dict): Book entry with casefolded search fields
+    """
+    for field in SEARCH_FIELDS.values():
+        for token in TOKEN_PATTERN.findall(book[field]):
+            index[field][token].add(book_id)
+
+def _search_index() -> dict:
+    """
+    Get the inverted search index for the book collection.
+    Maps each searchable field to a token -> set of book ids
+    dictionary. Rebuilt only when the collection has changed.
+    
+    Returns:
+        dict: Search index for the current collection
+    """
+    if st.session_state.get('search_index_version') != st.session_state.collection_version:
+        index = {field: defaultdict(set) for field in SEARCH_FIELDS.values()}
+        for book_id, book in st.session_state.book_collection.items():
+            _index_book(index, book_id, book)
+        st.session_state.search_index = index
+        st.session_state.search_index_version = st.session_state.collection_version
+    return st.session_state.search_index
+
+def _unindex_book(index: dict, book_id: str, book: dict) -> None:
+    """
+    Remove one book's tokens from the search index.
+    Tokens no other book uses are dropped, so the index only holds
+    tokens present in the collection.
+    
+    Args:
+        index (dict): Search index, field -> token -> set of book ids
+        book_id (str): Id of the book
+        book (dict): Book entry with casefolded search fields
+    """
+    for field in SEARCH_FIELDS.values():
+        for token in TOKEN_PATTERN.findall(book[field]):
+            book_ids = index[field].get(token)
+            if book_ids is not None:
+                book_ids.discard(book_id)
+                if not book_ids:
+                    del index[field][token]
+
+def _update_search_index(book_id: str, added: dict | None = None, removed: dict | None = None) -> None:
+    """
+    Apply a single-book change to an otherwise up-to-date search index,
+    so one insert, removal or status change doesn't force a full rebuild.
+    
+    Args:
+        book_id (str): Id of the book
+        added (dict): Book entry now in the collection, if any
+        removed (dict): Book entry no longer in the collection, if any
+    """
+    if st.session_state.get('search_index_version') == st.session_state.collection_version - 1:
+        if removed is not None:
+            _unindex_book(st.session_state.search_index, book_id, removed)
+        if added is not None:
+            _index_book(st.session_state.search_index, book_id, added)
+        st.session_state.search_index_version = st.session_state.collection_version
+
 def find_books(search_query: str, search_field: str) -> None:
     """
     Search books in the library based on given criteria.
-    Performs case-insensitive search on the specified field
-    and stores results in session state.
+    Performs a case-insensitive substring search on the casefolded
+    copy of the specified field and stores results in session state.
+    Candidates come from the inverted index using the longest token
+    of the query, so only those books are checked. Queries without a
+    token of at least MIN_INDEXED_TOKEN characters would match most
+    books anyway and use a vectorized scan of the column instead.
     
     Args:
         search_query (str): Term to search for
-        search_field (str): Field to search in ('Title', 'Author', or 'Genre')
-    """
-    search_query = search_query.lower()
-    matches = []
-
-    # Search through each book in the library
-    for book in st.session_state.book_collection:
-        if search_field == "Title" and search_query in book['title'].lower():
-            matches.append(book)
-        elif search_field == "Author" and search_query in book['author'].lower():
-            matches.append(book)
-        elif search_field == "Genre" and search_query in str(book['genre']):
-            matches.append(book)
+        search_field (str): Field to search in (a key of SEARCH_FIELDS)
+    """
+    books = st.session_state.book_collection
+    if not books:
+        st.session_state.search_output = []
+        return
+
+    query = search_query.casefold()
+    field = SEARCH_FIELDS[search_field]
+    longest = max(TOKEN_PATTERN.findall(query), key=len, default='')
+
+    if len(longest) >= MIN_INDEXED_TOKEN:
+        # Any book matching the query has a token containing its longest token
+        candidates = set()
+        for token, book_ids in _search_index()[field].items():
+            if longest in token:
+                candidates |= book_ids
+        hits = {book_id for book_id in candidates if query in books[book_id][field]}
+        # Report matches in collection order
+        matches = [book for book_id, book in books.items() if book_id in hits] if hits else []
+    else:
+        # Match against the whole casefolded column at once
+        frame = _collection_frame()
+        mask = frame[field].str.contains(query, regex=False, na=False)
+        matches = [books[book_id] for book_id in frame.index[mask]]
     st.session_state.search_output = matches
 
+def _library_counts() -> dict:
+    """
+    Get the running counts behind the library statistics.
+    Counted column-wise from the columnar collection view, kept in
+    session state and only rebuilt when the collection has changed;
+    single-book changes update the counts in place instead.
+    
+    Returns:
+        dict: Running counts including:
+            - total: Total number of books
+            - read: Number of read books
+            - genres: Counter of books by genre
+            - authors: Counter of books by author
+            - decades: Counter of books by publication decade
+    """
+    if st.session_state.get('library_counts_version') != st.session_state.collection_version:
+        frame = _collection_frame()
+        st.session_state.library_counts = {
+            'total': len(frame),
+            'read': int(frame['read_status'].sum()),
+            'genres': Counter(frame['genre'].value_counts().to_dict()),
+            'authors': Counter(frame['author'].value_counts().to_dict()),
+            'decades': Counter(frame['decade'].value_counts().to_dict())
+        }
+        st.session_state.library_counts_version = st.session_state.collection_version
+    return st.session_state.library_counts
+
+def _update_library_counts(added: dict | None = None, removed: dict | None = None) -> None:
+    """
+    Apply a single-book change to otherwise up-to-date library counts,
+    so one insert, removal or status change doesn't force a recount.
+    
+    Args:
+        added (dict): Book entry now in the collection, if any
+        removed (dict): Book entry no longer in the collection, if any
+    """
+    if st.session_state.get('library_counts_version') != st.session_state.collection_version - 1:
+        return
+    counts = st.session_state.library_counts
+    for book, step in ((removed, -1), (added, 1)):
+        if book is None:
+            continue
+        counts['total'] += step
+        counts['read'] += step * bool(book['read_status'])
+        for key, value in (('genres', book['genre']), ('authors', book['author']), ('decades', book['decade'])):
+            counts[key][value] += step
+            if not counts[key][value]:
+                del counts[key][value]
+    st.session_state.library_counts_version = st.session_state.collection_version
+
 def compute_library_metrics() -> dict:
     """
     Calculate various statistics about the library.
     Computes metrics including total books, read status,
-    genre distribution, author distribution, and decade distribution.
+    genre distribution, author distribution, and decade distribution
+    from the running library counts.
     
     Returns:
         dict: Dictionary containing library statistics including:
             - total_books: Total number of books
             - read_books: Number of read books
             - percent_read: Percentage of books read
-            - genres: Count of books by genre
-            - authors: Count of books by author
-            - decades: Count of books by publication decade
+            - genres: Count of books by genre, most common first
+            - top_authors: Book counts of the TOP_AUTHORS most frequent authors
+            - decades: Count of books by publication decade, in order
     """
-    # Calculate basic statistics
-    book_count = len(st.session_state.book_collection)
-    completed_books = sum(1 for book in st.session_state.book_collection if book['read_status'])
+    counts = _library_counts()
+    book_count = counts['total']
+    completed_books = counts['read']
     completion_rate = (completed_books / book_count * 100) if book_count > 0 else 0
-    
-    # Initialize dictionaries for distribution statistics
-    genre_distribution = {}
-    author_distribution = {}
-    decade_distribution = {}
-
-    # Calculate distribution statistics
-    for book in st.session_state.book_collection:
-        # Count genres
-        genre_distribution[book['genre']] = genre_distribution.get(book['genre'], 0) + 1
-            
-        # Count authors
-        author_distribution[book['author']] = author_distribution.get(book['author'], 0) + 1
-
-        # Count books by decade
-        decade = (book['publication_year'] // 10) * 10
-        decade_distribution[decade] = decade_distribution.get(decade, 0) + 1
-    
-    # Sort distributions for better presentation
-    genre_distribution = dict(sorted(genre_distribution.items(), key=lambda x: x[1], reverse=True))
-    author_distribution = dict(sorted(author_distribution.items(), key=lambda x: x[1], reverse=True))
-    decade_distribution = dict(sorted(decade_distribution.items(), key=lambda x: x[0]))
 
     return {
         'total_books': book_count,
         'read_books': completed_books,
         'percent_read': completion_rate,
-        'genres': genre_distribution,
-        'authors': author_distribution,
-        'decades': decade_distribution
+        'genres': dict(counts['genres'].most_common()),
+        # Only the top authors are shown; most_common(n) selects them with a heap
+        'top_authors': dict(counts['authors'].most_common(TOP_AUTHORS)),
+        'decades': dict(sorted(counts['decades'].items()))
     }
 
+def _invalidate_caches() -> None:
+    """
+    Drop cached results derived from the book collection.
+    Bumps the collection version, so per-session views that track it
+    are rebuilt on next use. The chart builders are keyed by their
+    counts and shared by all sessions, so they are never cleared here;
+    max_entries bounds them instead.
+    Called after every mutation.
+    """
+    st.session_state.collection_version += 1
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _build_read_pie(read_books: int, total_books: int):
+    """
+    Build the read vs unread pie chart.
+    
+    Args:
+        read_books (int): Number of read books
+        total_books (int): Total number of books
+        
+    Returns:
+        go.Figure: Donut chart of read vs unread books
+    """
+    import plotly.graph_objects as go  # Deferred until a chart is actually drawn
+
+    read_status_chart = go.Figure(data=[go.Pie(
+        labels=['Read', 'Unread'],
+        values=[read_books, total_books - read_books],
+        hole=0.4,
+        marker_colors=['#10B981', '#F87171'],
+    )])
+    read_status_chart.update_layout(
+        title_text='Read vs Unread Books',
+        showlegend=True,
+        height=400,
+    )
+    return read_status_chart
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _build_genre_bar(genres: tuple):
+    """
+    Build the books-by-genre bar chart.
+    
+    Args:
+        genres (tuple): (genre, count) pairs in display order
+        
+    Returns:
+        go.Figure: Bar chart of books per genre
+    """
+    import plotly.graph_objects as go  # Deferred until a chart is actually drawn
+
+    counts = [count for _, count in genres]
+    genre_chart = go.Figure(go.Bar(
+        x=[genre for genre, _ in genres],
+        y=counts,
+        marker_color=counts,
+        marker_colorscale='Blues',
+        marker_showscale=True,
+    ))
+    genre_chart.update_layout(
+        title_text='Books by Genre',
+        xaxis_title='Genre',
+        yaxis_title='Number of Books',
+        height=400,
+    )
+    return genre_chart
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _build_decades_line(decades: tuple):
+    """
+    Build the books-by-decade line chart.
+    
+    Args:
+        decades (tuple): (decade, count) pairs in chronological order
+        
+    Returns:
+        go.Figure: Line chart of books per publication decade
+    """
+    import plotly.graph_objects as go  # Deferred until a chart is actually drawn
+
+    fig_decades = go.Figure(go.Scatter(
+        x=[f'{decade}s' for decade, _ in decades],
+        y=[count for _, count in decades],
+        mode='lines+markers',
+        line_shape='spline',
+    ))
+    fig_decades.update_layout(
+        title_text='Books by Publication Decade',
+        xaxis_title='Decade',
+        yaxis_title='Number of Books',
+        height=400,
+    )
+    return fig_decades
+
 def generate_visualizations(metrics: dict) -> None:
     """
     Create and display visualizations for library statistics.
     Generates interactive charts using Plotly to visualize
-    the library's statistics.
+    the library's statistics. Figures come from builders cached with
+    st.cache_resource, which hands back the same Figure objects instead
+    of unpickling copies; st.plotly_chart only reads them, so sharing
+    is safe and only the st.plotly_chart calls run on every rerun.
     
     Args:
         metrics (dict): Dictionary containing library statistics
     """
     # Create pie chart for read vs unread books
     if metrics['total_books'] > 0:
-        read_status_chart = go.Figure(data=[go.Pie(
-            labels=['Read', 'Unread'],
-            values=[metrics['read_books'], metrics['total_books'] - metrics['read_books']],
-            hole=0.4,
-            marker_colors=['#10B981', '#F87171'],
-        )])
-        read_status_chart.update_layout(
-            title_text='Read vs Unread Books',
-            showlegend=True,
-            height=400,
-        )
-        st.plotly_chart(read_status_chart, use_container_width=True)
+        read_status_chart = _build_read_pie(metrics['read_books'], metrics['total_books'])
+        st.plotly_chart(read_status_chart, width="stretch")
     
     # Create bar chart for genres
     if metrics['genres']:
-        genre_data = pd.DataFrame({
-            'Genre': list(metrics['genres'].keys()),
-            'Count': list(metrics['genres'].values())
-        })
-        genre_chart = px.bar(
-            genre_data,
-            x='Genre',
-            y='Count',
-            color='Count',
-            color_continuous_scale=px.colors.sequential.Blues,
-        )
-        genre_chart.update_layout(
-            title_text='Books by Genre',
-            xaxis_title='Genre',
-            yaxis_title='Number of Books',
-            height=400,
-        )
-        st.plotly_chart(genre_chart, use_container_width=True)
+        genre_chart = _build_genre_bar(tuple(metrics['genres'].items()))
+        st.plotly_chart(genre_chart, width="stretch")
 
     # Create line chart for decades
     if metrics['decades']:
-        decades_df = pd.DataFrame({
-            'Decade': [f'{decade}s' for decade in metrics['decades'].keys()],
-            'Count': list(metrics['decades'].values())
-        })
-        fig_decades = px.line(
-            decades_df,
-            x='Decade',
-            y='Count',
-            markers=True,
-            line_shape='spline',
-        )
-        fig_decades.update_layout(
-            title_text='Books by Publication Decade',
-            xaxis_title='Decade',
-            yaxis_title='Number of Books',
-            height=400,
-        )
-        st.plotly_chart(fig_decades, use_container_width=True)
+        fig_decades = _build_decades_line(tuple(metrics['decades'].items()))
+        st.plotly_chart(fig_decades, width="stretch")
+
+def _card_fields(book: dict) -> dict:
+    """
+    Get the values used to fill CARD_TPL for a book.
+    Adds the read-status badge class and text to the book's own fields.
+    
+    Args:
+        book (dict): Book entry
+        
+    Returns:
+        dict: Mapping for CARD_TPL.format_map
+    """
+    if book['read_status']:
+        return {**book, 'badge_cls': 'read-badge', 'badge_text': "✅ Completed"}
+    return {**book, 'badge_cls': 'unread-badge', 'badge_text': "⏳ To Read"}
 
-# Load library data
-fetch_library_data()
+def _card_html(book: dict) -> str:
+    """
+    Get the rendered card HTML for a book.
+    Cards are cached in session state by book id together with the read
+    status they were rendered with, so only new or toggled books are
+    formatted again on a rerun.
+    
+    Args:
+        book (dict): Book entry
+        
+    Returns:
+        str: The book's card HTML
+    """
+    cached = st.session_state.card_html.get(book['id'])
+    if cached is None or cached[0] != book['read_status']:
+        cached = (book['read_status'], CARD_TPL.format_map(_card_fields(book)))
+        st.session_state.card_html[book['id']] = cached
+    return cached[1]
+
+def apply_library_edits(editor_key: str, book_ids: list) -> None:
+    """
+    Apply the edits made in the Manage Titles table.
+    Ticked removals delete the book; otherwise a changed Completed box
+    updates its read status.
+    
+    Args:
+        editor_key (str): Widget key of the table
+        book_ids (list): Book ids in table row order
+    """
+    for row, changes in st.session_state[editor_key]['edited_rows'].items():
+        book_id = book_ids[int(row)]
+        if changes.get('remove'):
+            delete_book(book_id)
+        elif 'read_status' in changes:
+            update_read_status(book_id, bool(changes['read_status']))
+
+# Load library data once per session; session state is authoritative afterwards
+if 'library_loaded' not in st.session_state:
+    fetch_library_data()
 
 # Create sidebar navigation
 st.sidebar.markdown("<h1 style='text-align: center;'><span class='emoji'>📋</span> Menu</h1>", unsafe_allow_html=True)
@@ -456,6 +1026,14 @@ nav_options = st.sidebar.radio(
     ["📖 Browse Collection", "➕ Add New Title", "🔎 Find Books", "📊 Reading Insights"]
 )
 
+# Explicit save: folds queued changes and the change log into library.json
+st.sidebar.button(
+    "💾 Save Library",
+    on_click=persist_library_data,
+    help="Changes are saved automatically; this also compacts the change log",
+    width="stretch"
+)
+
 # Set current view based on navigation selection
 if nav_options == "📖 Browse Collection":
     st.session_state.active_section = "library"
@@ -470,7 +1048,12 @@ elif nav_options == "📊 Reading Insights":
 st.markdown("<h1 class='main-header'><span class='emoji'>📚</span> My Personal Reading Sanctuary</h1>", unsafe_allow_html=True)
 
 # Add Book View
-if st.session_state.active_section == "add":
+@st.fragment
+@batched_writes()
+def render_add_section() -> None:
+    """
+    Render the Add Book view.
+    """
     st.markdown("<h2 class='sub-header'>➕ Expand Your Collection</h2>", unsafe_allow_html=True)
 
     with st.form(key="add_book_form"):
@@ -481,7 +1064,7 @@ if st.session_state.active_section == "add":
             author = st.text_input("✍️ Author's Name", max_chars=100)
             publication_year = st.number_input(
                 "📅 Year Published",
-                min_value=1000,
+                min_value=MIN_PUBLICATION_YEAR,
                 max_value=datetime.now().year,
                 step=1,
                 value=2023
@@ -501,78 +1084,106 @@ if st.session_state.active_section == "add":
             insert_book(title, author, publication_year, genre, read_bool)
 
     if st.session_state.new_book_flag:
-        st.markdown("<div class='success-message'>✨ New title added to your collection!</div>", unsafe_allow_html=True)
+        st.toast("✨ New title added to your collection!")
         st.session_state.new_book_flag = False
 
+    # Bulk import from a CSV file
+    st.markdown("<h3>📥 Import from CSV</h3>", unsafe_allow_html=True)
+    uploaded_file = st.file_uploader(
+        "📄 CSV with title, author, publication_year, genre and optional read_status columns",
+        type="csv"
+    )
+    if uploaded_file is not None and st.button("📥 Import Titles"):
+        try:
+            imported_count = insert_books(pd.read_csv(uploaded_file).to_dict('records'))
+            st.markdown(f"<div class='success-message'>📥 Imported {imported_count} title{'s' if imported_count != 1 else ''} into your collection!</div>", unsafe_allow_html=True)
+        except (KeyError, ValueError) as e:
+            st.markdown(f"<div class='warning-message'>📄 Could not import this file: {e}</div>", unsafe_allow_html=True)
+
 # View Library
-elif st.session_state.active_section == "library":
+@st.fragment
+@batched_writes()
+def render_library_section() -> None:
+    """
+    Render the View Library view.
+    """
     st.markdown("<h2 class='sub-header'>📚 Your Reading Collection</h2>", unsafe_allow_html=True)
 
     if not st.session_state.book_collection:
         st.markdown("<div class='warning-message'>📚 Your collection is empty. Start adding some titles!</div>", unsafe_allow_html=True)
     else:
-        cols = st.columns(2)
-        for i, book in enumerate(st.session_state.book_collection):
-            with cols[i % 2]:
-                st.markdown(f"""
-                <div class='book-card'>
-                    <h3>📖 {book['title']}</h3>
-                    <p><strong>✍️ Author:</strong> {book['author']}</p>
-                    <p><strong>📅 Published:</strong> {book['publication_year']}</p>
-                    <p><strong>🏷️ Category:</strong> {book['genre']}</p>
-                    <p><span class="{'read-badge' if book['read_status'] else 'unread-badge'}">{"✅ Completed" if book['read_status'] else "⏳ To Read"}</span></p>
-                </div>
-                """, unsafe_allow_html=True)
-
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button(f"🗑️ Remove", key=f"remove_{i}", use_container_width=True):
-                        if delete_book(i):
-                            st.rerun()
-                with col2:
-                    new_status = not book['read_status']
-                    status_label = "✅ Mark as Completed" if not book['read_status'] else "⏳ Mark as To Read"
-                    if st.button(status_label, key=f"status_{i}", use_container_width=True):
-                        st.session_state.book_collection[i]['read_status'] = new_status
-                        persist_library_data()
-                        st.rerun()
+        # Render every card in a single markdown element
+        cards_html = "".join(_card_html(book) for book in st.session_state.book_collection.values())
+        st.markdown(f"<div class='book-grid'>{cards_html}</div>", unsafe_allow_html=True)
+
+        # All per-book actions live in one editable table instead of a pair
+        # of buttons per book. The key follows the collection version, so
+        # the editor starts from fresh data once an edit has been applied.
+        st.markdown("<h3>🛠️ Manage Titles</h3>", unsafe_allow_html=True)
+        st.caption("Tick ✅ to mark a title as completed, or 🗑️ to remove it from your collection")
+        books = st.session_state.book_collection.values()
+        editor_key = f"library_editor_{st.session_state.collection_version}"
+        # The change callback runs before the rerun the edit triggers, so
+        # the cards above already reflect the change without st.rerun()
+        st.data_editor(
+            pd.DataFrame({
+                'title': [book['title'] for book in books],
+                'author': [book['author'] for book in books],
+                'read_status': [book['read_status'] for book in books],
+                'remove': False
+            }),
+            column_config={
+                'title': st.column_config.TextColumn("📖 Title"),
+                'author': st.column_config.TextColumn("✍️ Author"),
+                'read_status': st.column_config.CheckboxColumn("✅ Completed"),
+                'remove': st.column_config.CheckboxColumn("🗑️ Remove")
+            },
+            disabled=('title', 'author'),
+            hide_index=True,
+            width="stretch",
+            key=editor_key,
+            on_change=apply_library_edits,
+            args=(editor_key, list(st.session_state.book_collection))
+        )
 
     if st.session_state.book_deleted_flag:
         st.markdown("<div class='success-message'>🗑️ Title removed from your collection!</div>", unsafe_allow_html=True)
         st.session_state.book_deleted_flag = False
 
 # Search Books View
-elif st.session_state.active_section == "search":
+@st.fragment
+@batched_writes()
+def render_search_section() -> None:
+    """
+    Render the Search Books view.
+    """
     st.markdown("<h2 class='sub-header'>🔍 Discover Titles</h2>", unsafe_allow_html=True)
 
-    search_by = st.selectbox("🔍 Search by", ["📖 Title", "✍️ Author", "🏷️ Category"])
+    search_by = st.selectbox("🔍 Search by", list(SEARCH_FIELDS))
     search_term = st.text_input("🔎 Enter search term")
 
-    if st.button("🔍 Search", use_container_width=False):
+    if st.button("🔍 Search", width="content"):
         if search_term:
             with st.spinner("🔍 Exploring your collection..."):
                 find_books(search_term, search_by)
-                time.sleep(0.5)
 
     if hasattr(st.session_state, 'search_output'):
         if st.session_state.search_output:
             st.markdown(f"<h3>✨ Found {len(st.session_state.search_output)} Matches</h3>", unsafe_allow_html=True)
 
-            for i, book in enumerate(st.session_state.search_output):
-                st.markdown(f"""
-                <div class='book-card'>
-                    <h3>📖 {book['title']}</h3>
-                    <p><strong>✍️ Author:</strong> {book['author']}</p>
-                    <p><strong>📅 Published:</strong> {book['publication_year']}</p>
-                    <p><strong>🏷️ Category:</strong> {book['genre']}</p>
-                    <p><span class="{'read-badge' if book['read_status'] else 'unread-badge'}">{"✅ Completed" if book['read_status'] else "⏳ To Read"}</span></p>
-                </div>
-                """, unsafe_allow_html=True)
+            # Render every matching card in a single markdown element
+            results_html = "".join(_card_html(book) for book in st.session_state.search_output)
+            st.markdown(results_html, unsafe_allow_html=True)
         elif search_term:
             st.markdown("<div class='warning-message'>🔍 No matches found. Try a different search term.</div>", unsafe_allow_html=True)
 
 # Library Statistics View
-elif st.session_state.active_section == "stats":
+@st.fragment
+@batched_writes()
+def render_stats_section() -> None:
+    """
+    Render the Library Statistics view.
+    """
     st.markdown("<h2 class='sub-header'>📊 Reading Insights</h2>", unsafe_allow_html=True)
 
     if not st.session_state.book_collection:
@@ -589,8 +1200,19 @@ elif st.session_state.active_section == "stats":
 
         generate_visualizations(stats)
 
-        if stats['authors']:
+        if stats['top_authors']:
             st.markdown("<h3>👤 Favorite Authors</h3>", unsafe_allow_html=True)
-            top_authors = dict(list(stats['authors'].items())[:5])
-            for author, count in top_authors.items():
+            for author, count in stats['top_authors'].items():
                 st.markdown(f"**{author}**: {count} title{'s' if count > 1 else ''}")
+
+# Render the active view
+SECTION_RENDERERS = {
+    'add': render_add_section,
+    'library': render_library_section,
+    'search': render_search_section,
+    'stats': render_stats_section,
+}
+# Changes made during this run, including by widget callbacks, are
+# written in one go once the view has rendered
+with batched_writes():
+    SECTION_RENDERERS[st.session_state.active_section]()